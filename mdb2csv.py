@@ -1,10 +1,10 @@
 import csv
+import io
 import json
 import os
-import re
-import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from tkinter import filedialog, messagebox
+from operator import itemgetter
 
 try:
     import pyodbc
@@ -14,28 +14,47 @@ except Exception as e:
     PYODBC_IMPORT_ERROR = e
 
 try:
-    from tkinterdnd2 import DND_FILES, TkinterDnD
+    import orjson
 except ImportError:
-    DND_FILES = None
-    TkinterDnD = None
+    orjson = None
 
-WINDOWS_RESERVED_NAMES = {
+WINDOWS_RESERVED_NAMES = frozenset({
     "CON", "PRN", "AUX", "NUL",
     "COM1", "COM2", "COM3", "COM4", "COM5", "COM6", "COM7", "COM8", "COM9",
     "LPT1", "LPT2", "LPT3", "LPT4", "LPT5", "LPT6", "LPT7", "LPT8", "LPT9",
-}
+})
+# 禁止文字（<>:"/\|?* と制御文字）を "_" に置換する変換表
+SANITIZE_TABLE = {code: "_" for code in range(0x20)}
+SANITIZE_TABLE.update({ord(ch): "_" for ch in '<>:"/\\|?*'})
 SUPPORTED_EXTENSIONS = (".mdb",)
 SYSTEM_TABLE_PREFIXES = ("msys", "usys", "~")
+FETCH_BATCH_SIZE = 5000
+MAX_EXPORT_WORKERS = 8
+CSV_BUFFER_SIZE = 1 << 20
+UTF8_BOM = b"\xef\xbb\xbf"
+DESCRIPTION_NAME = itemgetter(0)
+
+
+def scrub_none_rows(rows):
+    """
+    None セルを "" に置換した行を順に返す。
+    None を含まない行（大半のケース）は再構築せずそのまま通す。
+    """
+    for row in rows:
+        if any(value is None for value in row):
+            yield tuple("" if value is None else value for value in row)
+        else:
+            yield row
 
 
 def sanitize_filename(name, default_name="table", max_length=120):
-    safe = re.sub(r'[<>:"/\\|?*\x00-\x1F]', "_", str(name))
+    safe = str(name).translate(SANITIZE_TABLE)
     safe = safe.strip().rstrip(".")
 
     if not safe:
         safe = default_name
 
-    if safe.split(".")[0].upper() in WINDOWS_RESERVED_NAMES:
+    if safe.partition(".")[0].upper() in WINDOWS_RESERVED_NAMES:
         safe = f"_{safe}"
 
     if len(safe) > max_length:
@@ -47,25 +66,79 @@ def sanitize_filename(name, default_name="table", max_length=120):
 def build_unique_save_path(output_dir, raw_name, used_names):
     base_name = sanitize_filename(raw_name)
     candidate = base_name
+    candidate_lower = base_name.lower()
+    base_short_cache = {}
     index = 1
 
-    while candidate.lower() in used_names:
+    while candidate_lower in used_names:
         suffix = f"_{index}"
         allowed = max(1, 120 - len(suffix))
-        candidate = f"{base_name[:allowed]}{suffix}"
-        candidate = candidate.rstrip(" .")
+        # 切り詰め済み base は suffix 桁数が変わったときだけ作り直す
+        base_short = base_short_cache.get(allowed)
+        if base_short is None:
+            base_short = base_name[:allowed]
+            base_short_cache[allowed] = base_short
+        # suffix は "_数字" なので末尾の空白/ピリオド除去は不要
+        candidate = f"{base_short}{suffix}"
+        candidate_lower = candidate.lower()
         index += 1
 
-    used_names.add(candidate.lower())
-    return os.path.join(output_dir, f"{candidate}.csv")
+    used_names.add(candidate_lower)
+    # output_dir は正規化済みなので join のセパレータ判定を介さず連結する
+    return f"{output_dir}{os.sep}{candidate}.csv"
 
 
 def is_supported_mdb_file(file_path):
     return os.path.isfile(file_path) and file_path.lower().endswith(SUPPORTED_EXTENSIONS)
 
 
+def split_dnd_list(data):
+    """
+    D&D イベントのパス一覧文字列を分割する。
+    形式は空白区切りで、空白を含むパスは {...} で囲まれる（Tcl リスト形式）。
+    Tcl インタプリタを経由しないぶん大量ドロップ時に速い。
+    解釈できない形（波括弧の対応が取れない等）の場合は None を返す。
+    """
+    data = str(data)
+    if "{" not in data:
+        return data.split()
+
+    paths = []
+    buf = []
+    depth = 0
+    for ch in data:
+        if ch == "{":
+            depth += 1
+            if depth == 1:
+                continue
+        elif ch == "}":
+            if depth == 0:
+                return None
+            depth -= 1
+            if depth == 0:
+                paths.append("".join(buf))
+                buf = []
+                continue
+        elif ch in " \t" and depth == 0:
+            if buf:
+                paths.append("".join(buf))
+                buf = []
+            continue
+        buf.append(ch)
+
+    if depth != 0:
+        return None
+    if buf:
+        paths.append("".join(buf))
+    return paths
+
+
 def parse_dnd_file_paths(root, data):
-    return [p for p in root.tk.splitlist(data) if p]
+    paths = split_dnd_list(data)
+    if paths is None:
+        # 未知の形式は Tcl の splitlist にフォールバック
+        paths = root.tk.splitlist(data)
+    return [p for p in paths if p]
 
 
 def is_user_table_name(name):
@@ -145,28 +218,8 @@ def to_int_or_default(value, default):
         return default
 
 
-def get_primary_key_columns(cursor, table_name):
-    """
-    テーブルの主キー列を KEY_SEQ 順で返す。
-    取得できない/主キーなしの場合は unique index を代替キーとして試す。
-    """
-    conn = cursor.connection
-    rows = []
-    desc = None
-    try:
-        pk_cursor = conn.cursor()
-    except Exception:
-        pk_cursor = None
-
-    try:
-        if pk_cursor is None:
-            pk_cursor = conn.cursor()
-        rows = pk_cursor.primaryKeys(table=table_name).fetchall()
-        desc = pk_cursor.description
-    except Exception:
-        rows = []
-        desc = None
-
+def parse_primary_key_rows(rows, desc):
+    """primaryKeys() の結果行から主キー列名を KEY_SEQ 順で取り出す。"""
     cols = []
     index_map = build_column_index(desc)
     col_idx = first_existing_key(index_map, ["column_name", "columnname", "column"])
@@ -192,19 +245,14 @@ def get_primary_key_columns(cursor, table_name):
             cols.append((seq, col_name))
 
     cols.sort(key=lambda x: x[0])
-    primary_key_cols = [name for _, name in cols]
-    if primary_key_cols:
-        return primary_key_cols
+    return [name for _, name in cols]
 
-    # primaryKeys が取れないドライバ向けのフォールバック:
-    # unique index の先頭候補を利用して順序安定化を試みる
-    try:
-        st_cursor = conn.cursor()
-        st_rows = st_cursor.statistics(table=table_name, unique=True).fetchall()
-        st_desc = st_cursor.description
-    except Exception:
-        return []
 
+def parse_unique_index_rows(st_rows, st_desc):
+    """
+    statistics(unique=True) の結果行から代替キー候補の列名リストを選ぶ。
+    primaryKeys が取れないドライバ向けのフォールバックに使う。
+    """
     st_index = build_column_index(st_desc)
     idx_name_i = first_existing_key(st_index, ["index_name"])
     col_name_i = first_existing_key(st_index, ["column_name", "columnname", "column"])
@@ -239,12 +287,8 @@ def get_primary_key_columns(cursor, table_name):
     return [name for _, name in best_cols]
 
 
-def get_table_column_names(cursor, table_name):
-    try:
-        rows = cursor.columns(table=table_name).fetchall()
-    except Exception:
-        return []
-
+def parse_column_name_rows(rows):
+    """columns() の結果行から列名リストを取り出す。"""
     names = []
     for row in rows:
         col_name = getattr(row, "column_name", None)
@@ -255,9 +299,130 @@ def get_table_column_names(cursor, table_name):
     return dedupe_keep_order(names)
 
 
-def build_select_query(table_name, order_columns):
+def parse_has_nullable_rows(rows):
+    """
+    columns() の結果行から NULL 許容列の有無を判定する。
+    判定不能な場合は True（None 置換を行う保守側）に倒す。
+    """
+    if not rows:
+        return True
+    for row in rows:
+        nullable = getattr(row, "nullable", None)
+        if nullable is None and len(row) > 10:
+            nullable = row[10]
+        if nullable is None or to_int_or_default(nullable, 1) != 0:
+            return True
+    return False
+
+
+def build_catalog_cache(conn, table_names):
+    """
+    テーブルごとのカタログ情報（主キー / unique index / 列一覧 / NULL許容有無）を
+    先にまとめて取得し、テーブル名 (lower) をキーとする辞書に載せる。
+    ホットループからは ODBC カタログ呼び出しを一切出さないための前処理。
+    """
+    pk_cache = {}
+    st_cache = {}
+    col_cache = {}
+    nullable_cache = {}
+
+    # カタログ照会はカーソルを 1 本だけ開いて使い回す
+    # （テーブルごとの SQLAllocHandle 往復をなくす）
+    meta_cursor = conn.cursor()
+
+    for table_name in table_names:
+        key = table_name.lower()
+
+        try:
+            rows = meta_cursor.primaryKeys(table=table_name).fetchall()
+            desc = meta_cursor.description
+        except Exception:
+            rows = []
+            desc = None
+
+        pk_cache[key] = parse_primary_key_rows(rows, desc)
+
+        # 代替キーは主キーが取れなかったテーブルに対してのみ照会する
+        if not pk_cache[key]:
+            try:
+                st_rows = meta_cursor.statistics(table=table_name, unique=True).fetchall()
+                st_cache[key] = parse_unique_index_rows(st_rows, meta_cursor.description)
+            except Exception:
+                st_cache[key] = []
+
+    # 列一覧は全テーブル分を 1 回の columns() で取得を試みる
+    all_column_rows = []
+    try:
+        all_column_rows = meta_cursor.columns().fetchall()
+    except Exception:
+        all_column_rows = []
+
+    wanted = {name.lower() for name in table_names}
+    grouped_rows = {}
+    for row in all_column_rows:
+        row_table = getattr(row, "table_name", None)
+        if row_table is None and len(row) > 2:
+            row_table = row[2]
+        if not row_table:
+            continue
+        row_key = str(row_table).lower()
+        if row_key in wanted:
+            grouped_rows.setdefault(row_key, []).append(row)
+
+    for row_key, rows in grouped_rows.items():
+        col_cache[row_key] = parse_column_name_rows(rows)
+        nullable_cache[row_key] = parse_has_nullable_rows(rows)
+
+    # 一括取得に失敗したテーブルのうち、ソートキー未確定のものだけ個別照会する
+    for table_name in table_names:
+        key = table_name.lower()
+        if key in col_cache or pk_cache.get(key) or st_cache.get(key):
+            continue
+        try:
+            rows = meta_cursor.columns(table=table_name).fetchall()
+        except Exception:
+            rows = []
+        col_cache[key] = parse_column_name_rows(rows)
+        nullable_cache[key] = parse_has_nullable_rows(rows)
+
+    return pk_cache, st_cache, col_cache, nullable_cache
+
+
+def table_has_nullable_columns(nullable_cache, table_name):
+    """NULL 許容列を含むか。キャッシュにないテーブルは True（保守側）。"""
+    return nullable_cache.get(table_name.lower(), True)
+
+
+def get_primary_key_columns(pk_cache, st_cache, table_name):
+    """
+    キャッシュからテーブルの主キー列（なければ代替キー列）を返す。
+    ODBC への I/O は発生しない。
+    """
+    key = table_name.lower()
+    pk_columns = pk_cache.get(key) or []
+    if pk_columns:
+        return pk_columns
+    return st_cache.get(key) or []
+
+
+def get_table_column_names(col_cache, table_name):
+    return col_cache.get(table_name.lower()) or []
+
+
+def has_single_indexed_pk(pk_cache, table_name):
+    """
+    単一列の主キーを持つテーブルか。
+    Access の主キーは常に暗黙の PrimaryKey インデックスに裏打ちされるため、
+    この場合は ORDER BY を省略してもインデックス走査で主キー順の結果になる
+    （Jet のソート用テンポラリスキャンを省ける）。
+    """
+    pk_columns = pk_cache.get(table_name.lower()) or []
+    return len(pk_columns) == 1
+
+
+def build_select_query(table_name, order_columns, skip_order_by=False):
     table_expr = quote_identifier(table_name)
-    if not order_columns:
+    if not order_columns or skip_order_by:
         return f"SELECT * FROM {table_expr}"
 
     order_expr = ", ".join(quote_identifier(col) for col in order_columns)
@@ -269,42 +434,73 @@ def get_access_connection(file_path):
         r"DRIVER={Microsoft Access Driver (*.mdb, *.accdb)};"
         rf"DBQ={file_path};"
     )
-    return pyodbc.connect(conn_str)
+    conn = pyodbc.connect(conn_str)
+
+    # WCHAR はワイヤ形式 (UTF-16LE) を明示してロケール経由の再デコードを省く。
+    # SQL_CHAR は ANSI コードページ (日本語環境では cp932) のままにしておく。
+    try:
+        conn.setdecoding(pyodbc.SQL_WCHAR, encoding="utf-16le")
+    except Exception:
+        pass
+
+    return conn
 
 
 def build_warning_messages(tables_sorted_by_first_column, tables_without_sort_key, max_items=5):
-    warnings = []
+    """
+    実行結果メッセージの注意文を生成する。
+    ポップアップ用（件数制限あり）とレポート用（全件）を 1 回の走査で作り、
+    (truncated_warnings, full_warnings) のタプルで返す。
+    """
+    truncated = []
+    full = []
+
+    def append_warning(header, tables):
+        full_text = f"{header}\n対象: {', '.join(tables)}"
+        full.append(full_text)
+        if max_items is not None and len(tables) > max_items:
+            truncated.append(f"{header}\n対象: {', '.join(tables[:max_items])} ...")
+        else:
+            truncated.append(full_text)
+
     if tables_sorted_by_first_column:
-        items = tables_sorted_by_first_column
-        if max_items is not None:
-            items = tables_sorted_by_first_column[:max_items]
-        limited = ", ".join(items)
-        suffix = ""
-        if max_items is not None and len(tables_sorted_by_first_column) > max_items:
-            suffix = " ..."
-        warnings.append(
-            "注意: 一部テーブルで主キーを検出できず、先頭列でソートして出力しました。"
-            f"\n対象: {limited}{suffix}"
+        append_warning(
+            "注意: 一部テーブルで主キーを検出できず、先頭列でソートして出力しました。",
+            tables_sorted_by_first_column,
         )
 
     if tables_without_sort_key:
-        items = tables_without_sort_key
-        if max_items is not None:
-            items = tables_without_sort_key[:max_items]
-        limited = ", ".join(items)
-        suffix = ""
-        if max_items is not None and len(tables_without_sort_key) > max_items:
-            suffix = " ..."
-        warnings.append(
-            "注意: 一部テーブルはソートキーを取得できず、ORDER BY なしで出力しました。"
-            f"\n対象: {limited}{suffix}"
+        append_warning(
+            "注意: 一部テーブルはソートキーを取得できず、ORDER BY なしで出力しました。",
+            tables_without_sort_key,
         )
 
-    return warnings
+    return truncated, full
+
+
+def encode_report_record(record):
+    """
+    レポート1件を JSON バイト列にする（orjson 利用可能時はそちらを使う）。
+    標準 json では indent を付けない（C 実装エンコーダのパスを維持する）。
+    """
+    if orjson is not None:
+        return orjson.dumps(record)
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def read_export_report(report_path):
+    """NDJSON レポートを1行=1レコードで順に返す。"""
+    with open(report_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
 
 
 def write_export_report(
     file_path,
+    dir_path,
+    source_name,
     success,
     exported_count,
     output_dir,
@@ -314,9 +510,8 @@ def write_export_report(
     tables_without_sort_key,
     warning_messages,
 ):
-    dir_path = os.path.dirname(file_path)
-    source_name = os.path.splitext(os.path.basename(file_path))[0]
-    report_path = os.path.join(dir_path, f"{source_name}_report.json")
+    report_path = os.path.join(dir_path, f"{source_name}_report.ndjson")
+    legacy_report_path = os.path.join(dir_path, f"{source_name}_report.json")
 
     record = {
         "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
@@ -331,26 +526,93 @@ def write_export_report(
         "message": message.replace("\n", " "),
     }
 
-    logs = []
-    if os.path.exists(report_path):
+    # 旧形式（JSON配列）のレポートが残っていれば、初回だけ NDJSON に移行する
+    if not os.path.exists(report_path) and os.path.exists(legacy_report_path):
         try:
-            with open(report_path, "r", encoding="utf-8-sig") as f:
+            with open(legacy_report_path, "r", encoding="utf-8-sig") as f:
                 loaded = json.load(f)
+            if isinstance(loaded, dict):
+                loaded = [loaded]
             if isinstance(loaded, list):
-                logs = loaded
-            elif isinstance(loaded, dict):
-                logs = [loaded]
+                with open(report_path, "ab") as f:
+                    for old_record in loaded:
+                        f.write(encode_report_record(old_record) + b"\n")
         except Exception:
-            logs = []
-
-    logs.append(record)
+            # 旧レポート破損時は移行せず、新規 NDJSON として書き始める
+            pass
 
-    with open(report_path, "w", encoding="utf-8") as f:
-        json.dump(logs, f, ensure_ascii=False, indent=2)
+    with open(report_path, "ab") as f:
+        f.write(encode_report_record(record) + b"\n")
 
     return report_path
 
 
+def open_csv_writer_stream(save_path):
+    """
+    CSV 出力用のテキストストリームを開く。
+    BOM を生バイトで先に書き、1 MiB バッファの 2 層構成で書き込む
+    （utf-8-sig のインクリメンタルエンコーダ経由より速く、
+    バッファ満杯時以外は write システムコールを発行しない）。
+    ワーカーごとの出力先を差し替えたい場合はこの関数だけを置き換えればよい。
+    """
+    raw = open(save_path, "wb", buffering=0)
+    try:
+        raw.write(UTF8_BOM)
+        buffered = io.BufferedWriter(raw, buffer_size=CSV_BUFFER_SIZE)
+        return io.TextIOWrapper(buffered, encoding="utf-8", newline="")
+    except Exception:
+        raw.close()
+        raise
+
+
+def export_single_table(file_path, table_name, query, save_path, has_nullable=True):
+    """
+    1テーブル分の SELECT 結果を save_path に CSV 出力する。
+    ワーカースレッドから呼ばれるため、接続はスレッドごとに開く
+    （Jet/ACE は同一 MDB への複数読み取りハンドルを許容する）。
+    """
+    conn = get_access_connection(file_path)
+    try:
+        cursor = conn.cursor()
+        cursor.arraysize = FETCH_BATCH_SIZE
+
+        # 空テーブルは TOP 1 プローブで検出し、ORDER BY の
+        # ソートプラン構築を省く（ヘッダのみの CSV は従来どおり出力する）
+        plain_query = build_select_query(table_name, [])
+        if query != plain_query:
+            probe = cursor.execute(
+                f"SELECT TOP 1 * FROM {quote_identifier(table_name)}"
+            ).fetchone()
+            if probe is None:
+                query = plain_query
+
+        cursor.execute(query)
+
+        columns = list(map(DESCRIPTION_NAME, cursor.description)) if cursor.description else []
+
+        with open_csv_writer_stream(save_path) as f:
+            writer = csv.writer(f)
+            if columns:
+                writer.writerow(columns)
+            # fetchmany でバッチ取得しながら逐次書き込む（全件を RAM に載せない）
+            while True:
+                batch = cursor.fetchmany(cursor.arraysize)
+                if not batch:
+                    break
+                if has_nullable:
+                    writer.writerows(scrub_none_rows(batch))
+                else:
+                    # 全列 NOT NULL のテーブルは None 置換パスを丸ごと飛ばす
+                    writer.writerows(batch)
+            # flush/fsync はテーブル末尾で 1 回だけ行う
+            f.flush()
+            os.fsync(f.buffer.raw.fileno())
+    finally:
+        conn.close()
+
+    return os.path.basename(save_path)
+
+
 def export_mdb_tables_to_csv(file_path):
     if pyodbc is None:
         return (
@@ -401,6 +663,7 @@ def export_mdb_tables_to_csv(file_path):
 
     try:
         cursor = conn.cursor()
+        cursor.arraysize = FETCH_BATCH_SIZE
         table_names = get_table_names_in_mdb_order(cursor)
 
         if not table_names:
@@ -409,46 +672,52 @@ def export_mdb_tables_to_csv(file_path):
 
         os.makedirs(output_dir, exist_ok=True)
 
+        # スキーマ参照と保存先の採番は直列で確定させ、
+        # 重い fetch + CSV 書き込みだけをテーブル単位で並列化する
+        pk_cache, st_cache, col_cache, nullable_cache = build_catalog_cache(conn, table_names)
+
+        tasks = []
         for table_name in table_names:
             save_path = build_unique_save_path(output_dir, table_name, used_names)
-            pk_columns = get_primary_key_columns(cursor, table_name)
+            pk_columns = get_primary_key_columns(pk_cache, st_cache, table_name)
             order_columns = pk_columns
 
             if not order_columns:
-                col_names = get_table_column_names(cursor, table_name)
+                col_names = get_table_column_names(col_cache, table_name)
                 if col_names:
                     order_columns = [col_names[0]]
                     tables_sorted_by_first_column.append(table_name)
                 else:
                     tables_without_sort_key.append(table_name)
 
-            query = build_select_query(table_name, order_columns)
-            cursor.execute(query)
-
-            columns = [desc[0] for desc in cursor.description] if cursor.description else []
-            rows = cursor.fetchall()
-
-            with open(save_path, "w", newline="", encoding="utf-8-sig") as f:
-                writer = csv.writer(f)
-                if columns:
-                    writer.writerow(columns)
-                for row in rows:
-                    writer.writerow([value if value is not None else "" for value in row])
-
-            exported_files.append(os.path.basename(save_path))
-            exported_count += 1
+            # 単一列主キーは PrimaryKey インデックス順に任せてソートを省く
+            query = build_select_query(
+                table_name,
+                order_columns,
+                skip_order_by=has_single_indexed_pk(pk_cache, table_name),
+            )
+            has_nullable = table_has_nullable_columns(nullable_cache, table_name)
+            tasks.append((table_name, query, save_path, has_nullable))
+
+        max_workers = min(MAX_EXPORT_WORKERS, len(tasks))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    export_single_table, file_path, table_name, query, save_path, has_nullable
+                )
+                for table_name, query, save_path, has_nullable in tasks
+            ]
+            # テーブル順で結果を回収する（exported_files の順序を保つ）
+            for future in futures:
+                exported_files.append(future.result())
+                exported_count += 1
 
         base_message = f"{exported_count} テーブルをCSV出力しました。\n保存先: {output_dir}"
-        popup_warning_messages = build_warning_messages(
+        popup_warning_messages, warning_messages = build_warning_messages(
             tables_sorted_by_first_column=tables_sorted_by_first_column,
             tables_without_sort_key=tables_without_sort_key,
             max_items=5,
         )
-        warning_messages = build_warning_messages(
-            tables_sorted_by_first_column=tables_sorted_by_first_column,
-            tables_without_sort_key=tables_without_sort_key,
-            max_items=None,
-        )
 
         message = base_message
         for warning_text in popup_warning_messages:
@@ -500,6 +769,18 @@ def export_mdb_tables_to_csv(file_path):
 
 
 def main():
+    # GUI 関連の import は起動時にだけ行う。
+    # ライブラリとして export_mdb_tables_to_csv を import する用途で
+    # Tk/Tcl のロードコスト（Tk 未導入環境では ImportError）を払わせない。
+    import tkinter as tk
+    from tkinter import filedialog, messagebox
+
+    try:
+        from tkinterdnd2 import DND_FILES, TkinterDnD
+    except ImportError:
+        DND_FILES = None
+        TkinterDnD = None
+
     if pyodbc is None:
         root = tk.Tk()
         root.withdraw()
@@ -530,8 +811,12 @@ def main():
         report_suffix = ""
 
         if report_enabled.get():
+            # パス分解は 1 回だけ行い、write_export_report には分解済みを渡す
+            basename = os.path.basename(file_path)
             report_path = write_export_report(
                 file_path=file_path,
+                dir_path=os.path.dirname(file_path),
+                source_name=os.path.splitext(basename)[0],
                 success=success,
                 exported_count=exported_count,
                 output_dir=output_dir,
@@ -582,7 +867,7 @@ def main():
 
         report_checkbox = tk.Checkbutton(
             root,
-            text="実行レポートを出力する（同じフォルダにJSON）",
+            text="実行レポートを出力する（同じフォルダにNDJSON）",
             variable=report_enabled,
         )
         report_checkbox.pack(pady=(0, 8))
@@ -621,7 +906,7 @@ def main():
 
     report_checkbox = tk.Checkbutton(
         root,
-        text="実行レポートを出力する（同じフォルダにJSON）",
+        text="実行レポートを出力する（同じフォルダにNDJSON）",
         variable=report_enabled,
     )
     report_checkbox.pack(pady=(0, 8))